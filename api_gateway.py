@@ -1,8 +1,39 @@
-import boto3
+import asyncio
+import functools
 import json
-from typing import Optional, Dict, Any
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 
 from api_resource import APIResource
+from clients import client
+from policies import TRUST_POLICY_JSON
+
+logger = logging.getLogger(__name__)
+
+# Permissions for the role created by create_gateway_role_with_policy
+_JOB_DETAILS_POLICY_JSON = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Sid": "VisualEditor0",
+                "Effect": "Allow",
+                "Action": ["dynamodb:PutItem", "dynamodb:GetItem"],
+                "Resource": "arn:aws:dynamodb:us-east-1:924305315075:table/job_portals",
+            },
+            {
+                "Effect": "Allow",
+                "Action": ["logs:*"],
+                "Resource": "*",
+            },
+        ],
+    }
+)
 
 
 class APIGateway:
@@ -11,61 +42,87 @@ class APIGateway:
     Handles creation and management of REST APIs and their resources.
     """
 
-    def __init__(self, region="us-east-1") -> None:
+    def __init__(
+        self,
+        region="us-east-1",
+        max_concurrency=8,
+        batch_size=8,
+        batch_delay=0.5,
+        cache_ttl=60,
+        executor: Optional[Executor] = None,
+        apigateway_client=None,
+    ) -> None:
         """
         Initialize the APIGateway client.
 
         Args:
             region: AWS region to use for API Gateway
+            max_concurrency: Maximum number of in-flight calls made by the *_async
+                methods, kept below API Gateway's control-plane rate limit and
+                clients.MAX_POOL_CONNECTIONS
+            batch_size: Number of calls create_tree issues concurrently per batch
+            batch_delay: Seconds create_tree waits between batches
+            cache_ttl: Seconds to reuse read-only responses (get_rest_api, get_resources)
+            executor: Executor the *_async methods run boto3 calls on (defaults to a
+                thread pool with max_concurrency workers)
+            apigateway_client: Long-lived boto3 API Gateway client to reuse
+                (defaults to the shared clients.client("apigateway", region))
         """
         self.region = region
-        self.apigateway = boto3.client("apigateway", region_name=region)
-        self.iam = boto3.client("iam", region_name=region)
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.cache_ttl = cache_ttl
+        self._read_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        # A thread semaphore rather than an asyncio one, so the limit isn't tied to
+        # the first event loop that used it (e.g. across separate asyncio.run calls)
+        self._limit = threading.BoundedSemaphore(max_concurrency)
+        self._pool = executor or ThreadPoolExecutor(max_workers=max_concurrency)
+        self.apigateway = apigateway_client or client("apigateway", region)
+        self.iam = client("iam", region)
         self.api_id = None
         self.resources = {}  # Cache of resource_id -> APIResource
+        # Guards loading the resource tree, so concurrent creates don't each reload it
+        self._resources_lock = threading.Lock()
+        # Index of (parent_id, path_part) -> APIResource, used to skip duplicate creates
+        self._by_parent_path: Dict[Tuple[str, str], APIResource] = {}
+        # (api_id, resource_id) -> APIResource looked up with get_resource
+        self._resource_cache: Dict[Tuple[str, str], APIResource] = {}
+        # Full path -> APIResource recorded with define_resource, created by flush()
+        self._pending_resources: Dict[str, APIResource] = {}
+        # id(resource) -> APIResource with operations from define_method, drained by flush()
+        self._defined: Dict[int, APIResource] = {}
+        self._defined_lock = threading.Lock()
+
+    @classmethod
+    def from_thread_pool(cls, executor: Executor, **kwargs) -> "APIGateway":
+        """
+        Create an APIGateway whose *_async methods run on an existing executor.
+
+        Keep the executor's max_workers at or below clients.MAX_POOL_CONNECTIONS
+        and API Gateway's rate limit.
+
+        Args:
+            executor: Executor to schedule blocking boto3 calls on
+            **kwargs: Other APIGateway constructor arguments
+        """
+        return cls(executor=executor, **kwargs)
 
     def create_gateway_role_with_policy(self, role_name="api_gateway_role"):
-        trust_policy = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Sid": "",
-                    "Effect": "Allow",
-                    "Principal": {"Service": "apigateway.amazonaws.com"},
-                    "Action": "sts:AssumeRole",
-                }
-            ],
-        }
-        job_details_policy = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Sid": "VisualEditor0",
-                    "Effect": "Allow",
-                    "Action": ["dynamodb:PutItem", "dynamodb:GetItem"],
-                    "Resource": "arn:aws:dynamodb:us-east-1:924305315075:table/job_portals",
-                },
-                {
-                    "Effect": "Allow",
-                    "Action": ["logs:*"],
-                    "Resource": "*",
-                },
-            ],
-        }
         role = self.iam.create_role(
             RoleName=role_name,
-            AssumeRolePolicyDocument=json.dumps(trust_policy),
+            AssumeRolePolicyDocument=TRUST_POLICY_JSON,
         )
         self.iam.put_role_policy(
             RoleName=role_name,
             PolicyName="job_details_policy",
-            PolicyDocument=json.dumps(job_details_policy),
+            PolicyDocument=_JOB_DETAILS_POLICY_JSON,
         )
-        print(f"Created role {role_name}")
+        logger.info("Created role %s", role_name)
         return role["Role"]["Arn"]
 
     def create_rest_api_gateway(
-        self, name, description="Created using API Gateway CLI"
+        self, name, description="Created using API Gateway CLI", tags=None
     ) -> Dict[str, Any]:
         """
         Create a new REST API Gateway.
@@ -73,6 +130,7 @@ class APIGateway:
         Args:
             name: Name of the API Gateway
             description: Description of the API Gateway
+            tags: Optional dict of tags, e.g. to find the API later with find_by_tag
 
         Returns:
             dict: API Gateway creation response
@@ -82,16 +140,18 @@ class APIGateway:
                 name=name,
                 description=description,
                 endpointConfiguration={"types": ["REGIONAL"]},
+                tags=tags or {},
             )
             self.api_id = response["id"]
-            print(f"Created API Gateway: {name} (ID: {self.api_id})")
+            logger.info("Created API Gateway: %s (ID: %s)", name, self.api_id)
 
             # Initialize the root resource
-            self._init_root_resource()
+            with self._resources_lock:
+                self._init_root_resource()
             return response
 
         except Exception as e:
-            print(f"Failed to create API Gateway: {str(e)}")
+            logger.error("Failed to create API Gateway: %s", e)
             raise
 
     def get_api_gateway(self, api_gateway_id):
@@ -104,34 +164,163 @@ class APIGateway:
         Returns:
             self if found, None otherwise
         """
-        self.api_id = self.apigateway.get_rest_api(restApiId=api_gateway_id)["id"]
+        self.api_id = self._get_rest_api(api_gateway_id)["id"]
+        self.invalidate_resources()
         return self
 
+    def find_by_tag(self, key, value) -> List[Dict[str, Any]]:
+        """
+        Find REST APIs tagged with key=value.
+
+        Args:
+            key: Tag key
+            value: Tag value
+
+        Returns:
+            list: get_rest_apis items whose tags match
+        """
+        paginator = self.apigateway.get_paginator("get_rest_apis")
+        return [
+            api
+            for page in paginator.paginate(PaginationConfig={"PageSize": 500})
+            for api in page.get("items", [])
+            if api.get("tags", {}).get(key) == value
+        ]
+
+    @staticmethod
+    def unique_name(base_name) -> str:
+        """
+        Append a UTC timestamp and random suffix to base_name.
+
+        Repeated or concurrent runs then create distinctly named APIs, which
+        can be told apart and cleaned up by name.
+        """
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        return f"{base_name}-{timestamp}-{random.randint(0, 99999)}"
+
+    def _cached(self, key, fetch):
+        """Return the cached value for key, calling fetch() if it is missing or expired."""
+        now = time.monotonic()
+        hit = self._read_cache.get(key)
+        if hit and hit[0] > now:
+            return hit[1]
+        value = fetch()
+        self._read_cache[key] = (now + self.cache_ttl, value)
+        return value
+
+    def cache_clear(self) -> None:
+        """Drop all cached read-only responses."""
+        self._read_cache.clear()
+
+    def _get_rest_api(self, api_id) -> Dict[str, Any]:
+        return self._cached(
+            ("get_rest_api", api_id),
+            lambda: self.apigateway.get_rest_api(restApiId=api_id),
+        )
+
+    def invalidate_resources(self) -> None:
+        """
+        Drop the cached resource tree.
+
+        The next call that needs it (get_root_resource, create_resource) reloads
+        it from API Gateway. Call this if resources were changed outside this client.
+        """
+        with self._resources_lock:
+            if hasattr(self, "root_resource"):
+                del self.root_resource
+            self.resources.clear()
+            self._by_parent_path.clear()
+            self._resource_cache.clear()
+
     def _init_root_resource(self) -> None:
-        """Initialize the root resource for the API."""
+        """Initialize the root resource for the API and index its existing resources."""
         if not self.api_id:
             raise ValueError(
                 "API Gateway not created. Call create_rest_api_gateway first."
             )
 
-        resources = self.apigateway.get_resources(restApiId=self.api_id)
+        items = list(self._iter_resources())
 
         # Find the root resource (the one with path "/")
-        root_resource = None
-        for resource in resources["items"]:
-            if resource["path"] == "/":
-                root_resource = resource
-                break
-
-        if not root_resource:
+        root_item = next((item for item in items if item["path"] == "/"), None)
+        if not root_item:
             raise ValueError(
                 "Root resource (path='/') not found in API Gateway resources"
             )
 
-        self.root_resource = APIResource(
-            self.apigateway, self.api_id, root_resource["id"], "/"
+        # Index every resource so create_resource can skip existing ones
+        self.resources.clear()
+        self._by_parent_path.clear()
+        for item in items:
+            resource = self._make_resource(item["id"], item["path"])
+            self.resources[item["id"]] = resource
+            if item is not root_item:
+                self._by_parent_path[(item["parentId"], item["pathPart"])] = resource
+
+        self.root_resource = self.resources[root_item["id"]]
+
+    def _make_resource(self, resource_id, path, api_id=None) -> "APIResource":
+        """Build an APIResource that shares this gateway's client and concurrency limit."""
+        return APIResource(
+            self.apigateway,
+            api_id or self.api_id,
+            resource_id,
+            path,
+            run_async=self._run_async,
+            on_define=self._track_defined,
         )
-        self.resources[root_resource["id"]] = self.root_resource
+
+    def _track_defined(self, resource: "APIResource") -> None:
+        """Remember a resource with recorded operations for the next flush()."""
+        with self._defined_lock:
+            self._defined[id(resource)] = resource
+
+    async def _run_async(self, func, *args, **kwargs):
+        """
+        Run a blocking boto3 call on the executor without blocking the event loop.
+
+        At most max_concurrency calls run at once.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._pool, functools.partial(self._call_limited, func, *args, **kwargs)
+        )
+
+    def _call_limited(self, func, *args, **kwargs):
+        with self._limit:
+            return func(*args, **kwargs)
+
+    async def _run_batched(self, coros, size=None, delay=None) -> List[Any]:
+        """
+        Await coroutines in batches of `size`, sleeping `delay` seconds between batches.
+
+        Spreading calls out this way keeps bulk operations under API Gateway's
+        rate limit instead of relying on throttling retries.
+
+        Returns:
+            list: Results in the same order as `coros`
+        """
+        size = size or self.batch_size
+        delay = self.batch_delay if delay is None else delay
+        coros = list(coros)
+        results = []
+        for start in range(0, len(coros), size):
+            if start:
+                await asyncio.sleep(delay)
+            results.extend(await asyncio.gather(*coros[start : start + size]))
+        return results
+
+    def _iter_resources(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all resources of the API, fetching pages lazily.
+
+        Uses the service maximum page size (500) to keep the number of requests low.
+        """
+        paginator = self.apigateway.get_paginator("get_resources")
+        for page in paginator.paginate(
+            restApiId=self.api_id, PaginationConfig={"PageSize": 500}
+        ):
+            yield from page.get("items", [])
 
     def get_api_details(self) -> Dict[str, Any]:
         """
@@ -144,7 +333,7 @@ class APIGateway:
             raise ValueError(
                 "API Gateway not created. Call create_rest_api_gateway first."
             )
-        return self.apigateway.get_rest_api(restApiId=self.api_id)
+        return self._get_rest_api(self.api_id)
 
     def get_root_resource(self) -> "APIResource":
         """
@@ -153,8 +342,12 @@ class APIGateway:
         Returns:
             APIResource: The root resource
         """
+        # Double-checked so concurrent create_resource calls load the tree once
+        # and a second load can't wipe resources another thread just added
         if not hasattr(self, "root_resource"):
-            self._init_root_resource()
+            with self._resources_lock:
+                if not hasattr(self, "root_resource"):
+                    self._init_root_resource()
         return self.root_resource
 
     def create_resource(
@@ -177,19 +370,15 @@ class APIGateway:
                 "API Gateway not created. Call create_rest_api_gateway first."
             )
 
-        # First, check if resource already exists
+        # First, check if resource already exists in the index
+        self.get_root_resource()
+        key = (parent.resource_id, path_part)
+        existing = self._by_parent_path.get(key)
+        if existing:
+            return existing
+
         try:
-            resources = self.apigateway.get_resources(restApiId=self.api_id, limit=500)
-            for item in resources.get("items", []):
-                if (
-                    item.get("parentId") == parent.resource_id
-                    and item.get("pathPart") == path_part
-                ):
-                    return APIResource(
-                        self.apigateway, self.api_id, item["id"], item.get("path", "")
-                    )
-
-            # If we get here, resource doesn't exist, so create it
+            # Resource doesn't exist, so create it
             response = self.apigateway.create_resource(
                 restApiId=self.api_id,
                 parentId=parent.resource_id,
@@ -197,26 +386,204 @@ class APIGateway:
                 **kwargs,
             )
 
-            # Build the full path
-            full_path = (
-                f"{parent.path.rstrip('/')}/{path_part}"
-                if parent.path != "/"
-                else f"/{path_part}"
-            )
-
             # Create and cache the new resource
-            resource = APIResource(
-                self.apigateway, self.api_id, response["id"], full_path
-            )
+            full_path = self._child_path(parent, path_part)
+            resource = self._make_resource(response["id"], full_path)
             self.resources[response["id"]] = resource
+            self._by_parent_path[key] = resource
+            self._read_cache.pop(("get_resources", self.api_id), None)
 
-            print(f"Created resource: {full_path}")
+            logger.debug("Created resource: %s", full_path)
             return resource
 
         except Exception as e:
-            print(f"Failed to create resource {path_part}: {str(e)}")
+            logger.error("Failed to create resource %s: %s", path_part, e)
             raise
 
+    @staticmethod
+    def _child_path(parent: "APIResource", path_part) -> str:
+        """Build the full path of a child resource."""
+        if parent.path == "/":
+            return f"/{path_part}"
+        return f"{parent.path.rstrip('/')}/{path_part}"
+
+    def define_resource(self, parent: "APIResource", path_part) -> "APIResource":
+        """
+        Get a resource under parent without creating it yet.
+
+        Returns the existing resource if there is one. Otherwise the returned
+        resource only has a path: record methods on it with
+        APIResource.define_method and the next flush() creates the resource and
+        its methods in the same import, then sets its resource_id.
+
+        Args:
+            parent: Parent APIResource object (existing or defined)
+            path_part: Path part for the resource (can include {param} for path parameters)
+
+        Returns:
+            APIResource: The existing or defined resource
+        """
+        if parent.resource_id:
+            self.get_root_resource()
+            existing = self._by_parent_path.get((parent.resource_id, path_part))
+            if existing:
+                return existing
+
+        full_path = self._child_path(parent, path_part)
+        if full_path not in self._pending_resources:
+            self._pending_resources[full_path] = self._make_resource(None, full_path)
+        return self._pending_resources[full_path]
+
+    async def create_resource_async(
+        self, parent: "APIResource", path_part, **kwargs
+    ) -> "APIResource":
+        """
+        Async version of create_resource.
+
+        Resources with different parents can be created concurrently with asyncio.gather.
+        """
+        return await self._run_async(self.create_resource, parent, path_part, **kwargs)
+
+    async def create_tree(
+        self, spec: Dict[str, Any], parent: Optional["APIResource"] = None
+    ) -> Dict[str, "APIResource"]:
+        """
+        Create a tree of resources, one depth level at a time.
+
+        Parents must exist before their children, so every resource at a given
+        depth is created in batches before moving on to the next level.
+
+        Args:
+            spec: Nested dict of path part -> child spec, e.g.
+                {"tasks": {"{taskId}": {}}}
+            parent: Resource to create the tree under (defaults to the root resource)
+
+        Returns:
+            dict: Full path -> APIResource for every resource in the spec
+        """
+        if parent is None:
+            parent = await self._run_async(self.get_root_resource)
+
+        created = {}
+        level = [(parent, spec)]
+        while level:
+            children = [
+                (resource, path_part, child_spec or {})
+                for resource, level_spec in level
+                for path_part, child_spec in level_spec.items()
+            ]
+            resources = await self._run_batched(
+                self.create_resource_async(resource, path_part)
+                for resource, path_part, _ in children
+            )
+            created.update((resource.path, resource) for resource in resources)
+            level = [
+                (resource, child_spec)
+                for resource, (_, _, child_spec) in zip(resources, children)
+                if child_spec
+            ]
+        return created
+
+    def apply_openapi(self, doc: Dict[str, Any], mode="merge") -> Dict[str, Any]:
+        """
+        Import an OpenAPI/Swagger document into the API with a single call.
+
+        Args:
+            doc: OpenAPI document with paths, methods and x-amazon-apigateway-integration
+            mode: "merge" to add to the existing API, or "overwrite" to replace it
+                (overwrite removes anything not in the document)
+
+        Returns:
+            dict: put_rest_api response
+        """
+        if not self.api_id:
+            raise ValueError(
+                "API Gateway not created. Call create_rest_api_gateway first."
+            )
+
+        try:
+            # Compact separators keep large documents small; boto3 sends bytes as-is
+            body = json.dumps(doc, separators=(",", ":")).encode()
+            response = self.apigateway.put_rest_api(
+                restApiId=self.api_id, mode=mode, body=body
+            )
+            # The import may have added resources, so reload the tree on next use
+            self.invalidate_resources()
+            self.cache_clear()
+            logger.info("Imported OpenAPI definition into API %s (%s)", self.api_id, mode)
+            return response
+
+        except Exception as e:
+            logger.error("Failed to import OpenAPI definition: %s", e)
+            raise
+
+    def flush(self, mode="merge") -> Optional[Dict[str, Any]]:
+        """
+        Apply every method recorded with APIResource.define_method in one import.
+
+        Covers every resource of this API that define_method was called on,
+        including ones from before an earlier flush() reloaded the tree;
+        resources from define_resource are created by the same import.
+
+        Args:
+            mode: put_rest_api mode, see apply_openapi
+
+        Returns:
+            dict: put_rest_api response, or None if nothing was recorded
+        """
+        with self._defined_lock:
+            resources = [
+                resource
+                for resource in self._defined.values()
+                if resource.api_id == self.api_id and resource.openapi_operations()
+            ]
+        if not resources:
+            return None
+        pending = [
+            resource
+            for resource in self._pending_resources.values()
+            if resource.api_id == self.api_id
+        ]
+
+        doc = {
+            "swagger": "2.0",
+            "info": {"title": self.get_api_details()["name"], "version": "1.0"},
+            "paths": {
+                resource.path: resource.openapi_operations() for resource in resources
+            },
+        }
+        response = self.apply_openapi(doc, mode=mode)
+        with self._defined_lock:
+            for resource in resources:
+                resource.clear_openapi_operations()
+                self._defined.pop(id(resource), None)
+        self._pending_resources.clear()
+        if pending:
+            self._resolve_pending(pending)
+        return response
+
+    def _resolve_pending(self, pending: List["APIResource"]) -> None:
+        """
+        Give resources from define_resource the ids API Gateway assigned on import.
+
+        The resource tree is reloaded and each pending resource is matched by
+        path. The caller's objects replace the reloaded ones in the index, so
+        they stay usable with add_method, add_integration and get_methods.
+        """
+        self.get_root_resource()
+        by_path = {resource.path: resource for resource in self.resources.values()}
+        for resource in pending:
+            loaded = by_path.get(resource.path)
+            if loaded is None:
+                # Nothing was defined on or below it, so the import didn't create it
+                continue
+            resource.resource_id = loaded.resource_id
+            self.resources[resource.resource_id] = resource
+        self._by_parent_path = {
+            key: self.resources[resource.resource_id]
+            for key, resource in self._by_parent_path.items()
+        }
+
     def deploy_to_stage(
         self,
         stage_name,
@@ -247,12 +614,9 @@ class APIGateway:
                 restApiId=self.api_id, description=description, **kwargs
             )
 
-            # Check if stage exists
+            # Check if stage exists with a direct lookup rather than listing all stages
             try:
-                # Try to get the stage
-                stage = self.apigateway.get_stage(
-                    restApiId=self.api_id, stageName=stage_name
-                )
+                self.apigateway.get_stage(restApiId=self.api_id, stageName=stage_name)
 
                 # If we get here, stage exists - update it
                 stage = self.apigateway.update_stage(
@@ -266,7 +630,7 @@ class APIGateway:
                         }
                     ],
                 )
-                print(f"Updated existing stage: {stage_name}")
+                logger.info("Updated existing stage: %s", stage_name)
 
             except self.apigateway.exceptions.NotFoundException:
                 # Stage doesn't exist - create it
@@ -276,9 +640,9 @@ class APIGateway:
                     deploymentId=deployment["id"],
                     description=stage_description,
                 )
-                print(f"Created new stage: {stage_name}")
+                logger.info("Created new stage: %s", stage_name)
 
-            print(f"Successfully deployed to stage: {stage_name}")
+            logger.info("Successfully deployed to stage: %s", stage_name)
             return {
                 "deployment": deployment,
                 "stage": stage,
@@ -286,28 +650,37 @@ class APIGateway:
             }
 
         except Exception as e:
-            print(f"Failed to deploy API: {str(e)}")
+            logger.error("Failed to deploy API: %s", e)
             raise
 
     def get_resources(self, restApiId):
-        return self.apigateway.get_resources(restApiId=restApiId)
+        return self._cached(
+            ("get_resources", restApiId),
+            lambda: self.apigateway.get_resources(restApiId=restApiId),
+        )
 
     def get_resource(self, restApiId, resourceId):
-        response = self.apigateway.get_resource(restApiId=restApiId, resourceId=resourceId)
-        # Create and return an APIResource object
-        return APIResource(
-            self.apigateway,
-            restApiId,
-            response["id"],
-            response["path"]
-        )
+        # Reuse resources that are already loaded or were looked up before
+        if restApiId == self.api_id and resourceId in self.resources:
+            return self.resources[resourceId]
+
+        key = (restApiId, resourceId)
+        if key not in self._resource_cache:
+            response = self.apigateway.get_resource(
+                restApiId=restApiId, resourceId=resourceId
+            )
+            # Create and cache an APIResource object
+            self._resource_cache[key] = self._make_resource(
+                response["id"], response["path"], api_id=restApiId
+            )
+        return self._resource_cache[key]
 
 
-if __name__ == "__main__":
-    # Example usage of the refactored API Gateway client
+def demo():
+    """Example usage of the API Gateway client: build, configure and deploy a small API."""
     try:
         # Configuration
-        api_name = "job-portal-api-3"
+        api_name = APIGateway.unique_name("job-portal-api")
         api_description = "API for Job Portal Application"
         stage_name = "dev"
         region = "us-east-1"
@@ -318,52 +691,55 @@ if __name__ == "__main__":
 
         # Create a new REST API
         print(f"Creating API: {api_name}")
-        api_gateway.create_rest_api_gateway(api_name, api_description)
-
-        # Get the root resource
-        root_resource = api_gateway.get_root_resource()
-
-        # Create a resource for jobs
-        print("Creating 'jobs' resource...")
-        jobs_resource = api_gateway.create_resource(root_resource, "tasks")
-
-        # Add GET method to jobs resource with MOCK integration
-        print("Adding GET method to 'tasks' resource with MOCK integration...")
-        jobs_resource.add_method("GET")
-        jobs_resource.add_integration(
-            http_method="GET",
-            integration_type="MOCK",
-            request_templates={"application/json": '{"statusCode": 200}'},
+        api_gateway.create_rest_api_gateway(
+            api_name, api_description, tags={"project": "job-portal"}
         )
 
-        # Example: Add a dynamic resource for a specific job
-        print("Creating dynamic 'tasks/{taskId}' resource...")
-        job_resource = api_gateway.create_resource(jobs_resource, "{taskId}")
-
-        # Add GET method to the dynamic job resource with MOCK integration
-        print("Adding GET method to 'tasks/{taskId}' resource with MOCK integration...")
-        job_resource.add_method("GET")
-        job_resource.add_integration(
-            http_method="GET",
-            integration_type="MOCK",
-            request_templates={
-                "application/json": '{"statusCode": 200, "jobId": "$input.params(\'taskId\')"}'
-            },
-        )
+        # A method must exist before its integration is added, but the methods
+        # themselves are independent, so configure them concurrently
+        async def add_mock_method(resource, http_method, method_kwargs=None, **kwargs):
+            await resource.add_method_async(http_method, **(method_kwargs or {}))
+            await resource.add_integration_async(
+                http_method=http_method, integration_type="MOCK", **kwargs
+            )
 
-        # Example: Add a POST method to jobs resource with MOCK integration
-        print("Adding POST method to 'jobs' resource with MOCK integration...")
-        jobs_resource.add_method(
-            "POST", request_parameters={"method.request.header.Content-Type": True}
-        )
-        jobs_resource.add_integration(
-            http_method="POST",
-            integration_type="MOCK",
-            requestTemplates={
-                "application/json": '{"statusCode": 200, "message": "Job created successfully"}'
-            },
-            passthrough_behavior="WHEN_NO_MATCH",
-        )
+        async def build_resources():
+            # Create 'tasks' and the dynamic 'tasks/{taskId}' resource for a specific job
+            print("Creating 'tasks' and 'tasks/{taskId}' resources...")
+            tree = await api_gateway.create_tree({"tasks": {"{taskId}": {}}})
+            jobs_resource = tree["/tasks"]
+            job_resource = tree["/tasks/{taskId}"]
+
+            print("Adding GET/POST methods to 'tasks' and GET to 'tasks/{taskId}' with MOCK integration...")
+            await asyncio.gather(
+                add_mock_method(
+                    jobs_resource,
+                    "GET",
+                    request_templates={"application/json": '{"statusCode": 200}'},
+                ),
+                add_mock_method(
+                    job_resource,
+                    "GET",
+                    request_templates={
+                        "application/json": '{"statusCode": 200, "jobId": "$input.params(\'taskId\')"}'
+                    },
+                ),
+                add_mock_method(
+                    jobs_resource,
+                    "POST",
+                    method_kwargs={
+                        "request_parameters": {
+                            "method.request.header.Content-Type": True
+                        }
+                    },
+                    requestTemplates={
+                        "application/json": '{"statusCode": 200, "message": "Job created successfully"}'
+                    },
+                    passthrough_behavior="WHEN_NO_MATCH",
+                ),
+            )
+
+        asyncio.run(build_resources())
 
         # Deploy the API
         print(f"Deploying API to stage: {stage_name}")
@@ -380,3 +756,8 @@ if __name__ == "__main__":
 
     except Exception as e:
         print(f"An error occurred: {str(e)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    demo()
@@ -1,5 +1,33 @@
+import asyncio
+import logging
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Optional put_integration parameters accepted by add_integration, snake_case -> camelCase
+_SNAKE_TO_CAMEL = {
+    "connection_type": "connectionType",
+    "connection_id": "connectionId",
+    "request_parameters": "requestParameters",
+    "request_templates": "requestTemplates",
+    "passthrough_behavior": "passthroughBehavior",
+    "cache_namespace": "cacheNamespace",
+    "cache_key_parameters": "cacheKeyParameters",
+    "content_handling": "contentHandling",
+    "timeout_in_millis": "timeoutInMillis",
+    "tls_config": "tlsConfig",
+}
+_VALID_PARAMS = frozenset(_SNAKE_TO_CAMEL.values())
+
+# Method request parameter location (method.request.<location>.<name>) -> OpenAPI "in"
+_PARAM_LOCATIONS = {"header": "header", "querystring": "query", "path": "path"}
+
+
 class APIResource:
-    def __init__(self, apigateway_client, api_id, resource_id, path):
+    def __init__(
+        self, apigateway_client, api_id, resource_id, path, run_async=None, on_define=None
+    ):
         """
         Initialize a new API Resource.
 
@@ -8,12 +36,70 @@ class APIResource:
             api_id: ID of the API Gateway
             resource_id: ID of this resource
             path: Path of this resource
+            run_async: Coroutine function used by the *_async methods to run a
+                blocking call off the event loop (defaults to asyncio.to_thread)
+            on_define: Called with this resource whenever define_method records an
+                operation, so APIGateway.flush() can find it
         """
         self.apigateway = apigateway_client
         self.api_id = api_id
         self.resource_id = resource_id
         self.path = path
         self.methods = {}
+        self._run_async = run_async or asyncio.to_thread
+        self._on_define = on_define
+        # Methods as described by API Gateway, loaded lazily by get_methods()
+        self._methods_lock = threading.Lock()
+        self._methods_loaded: Optional[dict] = None
+        # OpenAPI operations recorded by define_method, applied by APIGateway.flush()
+        self._openapi_operations = {}
+
+    def get_methods(self):
+        """
+        Get the methods configured on this resource in API Gateway.
+
+        The methods (with their integrations and method responses) are fetched
+        once with a single get_resource call and cached; add_method and
+        add_integration keep the cache up to date.
+
+        Returns:
+            dict: HTTP method -> method description
+        """
+        if self._methods_loaded is None:
+            with self._methods_lock:
+                if self._methods_loaded is None:
+                    response = self.apigateway.get_resource(
+                        restApiId=self.api_id,
+                        resourceId=self.resource_id,
+                        embed=["methods"],
+                    )
+                    self._methods_loaded = response.get("resourceMethods", {})
+        return self._methods_loaded
+
+    def get_integrations(self):
+        """
+        Get the integrations configured on this resource's methods.
+
+        Returns:
+            dict: HTTP method -> integration description
+        """
+        return {
+            http_method: method["methodIntegration"]
+            for http_method, method in self.get_methods().items()
+            if "methodIntegration" in method
+        }
+
+    def get_method_responses(self):
+        """
+        Get the method responses configured on this resource's methods.
+
+        Returns:
+            dict: HTTP method -> {status code -> method response}
+        """
+        return {
+            http_method: method.get("methodResponses", {})
+            for http_method, method in self.get_methods().items()
+        }
 
     def add_method(
         self,
@@ -46,25 +132,130 @@ class APIResource:
                 requestParameters=request_parameters,
                 **kwargs,
             )
-            print(f"Added {http_method} method to resource {self.path}")
+            logger.debug("Added %s method to resource %s", http_method, self.path)
             self.methods[http_method.upper()] = response
-            self.apigateway.put_method_response(
+            method_response = self.apigateway.put_method_response(
                 restApiId=self.api_id,
                 resourceId=self.resource_id,
                 httpMethod=http_method.upper(),
                 statusCode="200",
             )
+            if self._methods_loaded is not None:
+                self._methods_loaded[http_method.upper()] = dict(
+                    response, methodResponses={"200": method_response}
+                )
             return response
         except Exception as e:
-            print(f"Failed to add {http_method} method: {str(e)}")
+            logger.error("Failed to add %s method: %s", http_method, e)
             raise
 
-    def create_resource(self, path_part, **kwargs):
-        self.apigateway.get_resources(
-            restApiId=self.api_id,
-            parentId=self.resource_id,
-        )
+    def define_method(
+        self,
+        http_method,
+        integration_type,
+        integration_http_method=None,
+        uri=None,
+        credentials=None,
+        method_request_parameters=None,
+        **kwargs,
+    ):
+        """
+        Record a method and its integration for the next APIGateway.flush().
+
+        Equivalent to add_method followed by add_integration, but no API calls
+        are made here: flush() imports every recorded method in one
+        put_rest_api call instead of four calls per method.
+
+        Args:
+            http_method: HTTP method (GET, POST, etc.)
+            integration_type: Type of integration (AWS, AWS_PROXY, HTTP, MOCK, etc.)
+            integration_http_method: HTTP method for the integration
+            uri: URI for the integration
+            credentials: IAM role ARN for the integration
+            method_request_parameters: Method request parameters mapping
+                (add_method's request_parameters)
+            **kwargs: Additional integration parameters, as for add_integration
+
+        Returns:
+            dict: The recorded OpenAPI operation
+        """
+        integration = {
+            "type": integration_type.lower(),
+            "httpMethod": integration_http_method or http_method.upper(),
+            "responses": {
+                "default": {
+                    "statusCode": "200",
+                    "responseTemplates": {"application/json": ""},
+                }
+            },
+        }
+        if uri:
+            integration["uri"] = uri
+        if credentials:
+            integration["credentials"] = credentials
+        for key, value in kwargs.items():
+            camel_key = _SNAKE_TO_CAMEL.get(key, key)
+            if camel_key in _VALID_PARAMS:
+                integration[camel_key] = value
+            else:
+                logger.warning("Ignoring invalid parameter '%s' for integration", key)
+        if "passthroughBehavior" in integration:
+            integration["passthroughBehavior"] = integration[
+                "passthroughBehavior"
+            ].lower()
+
+        # Path parameters are required by the import, other parameters come
+        # from method.request.<location>.<name> keys
+        parameters = {
+            ("path", part[1:-1]): True
+            for part in self.path.split("/")
+            if part.startswith("{") and part.endswith("}")
+        }
+        for key, required in (method_request_parameters or {}).items():
+            _, _, location, name = key.split(".", 3)
+            parameters[(_PARAM_LOCATIONS[location], name)] = required
+
+        operation = {
+            "responses": {"200": {"description": "200 response"}},
+            "x-amazon-apigateway-integration": integration,
+        }
+        if parameters:
+            operation["parameters"] = [
+                {"name": name, "in": location, "required": required, "type": "string"}
+                for (location, name), required in parameters.items()
+            ]
 
+        # OpenAPI has no "any" operation; API Gateway uses its own extension key
+        if http_method.upper() == "ANY":
+            operation_key = "x-amazon-apigateway-any-method"
+        else:
+            operation_key = http_method.lower()
+        self._openapi_operations[operation_key] = operation
+        if self._on_define:
+            self._on_define(self)
+        return operation
+
+    def openapi_operations(self):
+        """
+        Get the operations recorded by define_method that haven't been flushed.
+
+        Returns:
+            dict: OpenAPI operation key (lower-case HTTP method, or
+                x-amazon-apigateway-any-method for ANY) -> OpenAPI operation
+        """
+        return dict(self._openapi_operations)
+
+    def clear_openapi_operations(self):
+        """Forget recorded operations and reload methods from API Gateway on next use."""
+        self._openapi_operations.clear()
+        self._methods_loaded = None
+
+    async def add_method_async(self, http_method, **kwargs):
+        """Async version of add_method."""
+        return await self._run_async(self.add_method, http_method, **kwargs)
+
+    def create_resource(self, path_part, **kwargs):
+        # Doesn't check for an existing child; use APIGateway.create_resource for that
         return self.apigateway.create_resource(
             restApiId=self.api_id,
             parentId=self.resource_id,
@@ -96,7 +287,10 @@ class APIResource:
             dict: Integration creation response
         """
 
-        if http_method.upper() not in self.methods:
+        if (
+            http_method.upper() not in self.methods
+            and http_method.upper() not in self.get_methods()
+        ):
             raise ValueError(f"Method {http_method} not found on resource {self.path}")
 
         try:
@@ -116,44 +310,47 @@ class APIResource:
             if credentials:
                 params["credentials"] = credentials
 
-            snake_to_camel = {
-                "connection_type": "connectionType",
-                "connection_id": "connectionId",
-                "request_parameters": "requestParameters",
-                "request_templates": "requestTemplates",
-                "passthrough_behavior": "passthroughBehavior",
-                "cache_namespace": "cacheNamespace",
-                "cache_key_parameters": "cacheKeyParameters",
-                "content_handling": "contentHandling",
-                "timeout_in_millis": "timeoutInMillis",
-                "tls_config": "tlsConfig",
-            }
-
-            valid_params = set(snake_to_camel.values())
             # Only add kwargs that are valid API Gateway parameters
             for key, value in kwargs.items():
-                camel_key = snake_to_camel.get(key, key)
-                if camel_key in valid_params:
+                camel_key = _SNAKE_TO_CAMEL.get(key, key)
+                if camel_key in _VALID_PARAMS:
                     params[camel_key] = value
                 else:
-                    print(
-                        f"Warning: Ignoring invalid parameter '{key}' for put_integration"
+                    logger.warning(
+                        "Ignoring invalid parameter '%s' for put_integration", key
                     )
 
             response = self.apigateway.put_integration(**params)
-            print(
-                f"Added {integration_type} integration to {http_method} method on resource {self.path}"
+            logger.debug(
+                "Added %s integration to %s method on resource %s",
+                integration_type,
+                http_method,
+                self.path,
             )
             # Configure default integration response
-            self.apigateway.put_integration_response(
+            integration_response = self.apigateway.put_integration_response(
                 restApiId=self.api_id,
                 resourceId=self.resource_id,
                 httpMethod=http_method.upper(),
                 statusCode="200",
                 responseTemplates={"application/json": ""},
             )
+            if self._methods_loaded is not None:
+                self._methods_loaded.setdefault(http_method.upper(), {})[
+                    "methodIntegration"
+                ] = dict(response, integrationResponses={"200": integration_response})
 
             return response
         except Exception as e:
-            print(f"Failed to add integration: {str(e)}")
+            logger.error("Failed to add integration: %s", e)
             raise
+
+    async def add_integration_async(self, http_method, integration_type, **kwargs):
+        """
+        Async version of add_integration.
+
+        The method must already have been added, so await add_method_async first.
+        """
+        return await self._run_async(
+            self.add_integration, http_method, integration_type, **kwargs
+        )
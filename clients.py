@@ -0,0 +1,38 @@
+import functools
+
+import boto3
+from botocore.config import Config
+
+# One session for the whole process, so credentials and endpoints are resolved once
+_session = boto3.session.Session()
+
+# Connections kept per client. Must be >= the number of concurrent calls
+# (APIGateway's max_concurrency), otherwise extra calls wait for a free connection.
+MAX_POOL_CONNECTIONS = 50
+
+# Adaptive retries back off client-side when throttled; keep-alive avoids
+# idle pooled connections being dropped between calls
+_config = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+
+@functools.lru_cache(maxsize=32)
+def client(service, region="us-east-1"):
+    """
+    Get a shared boto3 client for a service and region.
+
+    Clients are expensive to build (credential chain, endpoint resolution,
+    SSL context) but are thread-safe, so each (service, region) pair is
+    created once and reused.
+
+    Args:
+        service: AWS service name, e.g. "apigateway" or "iam"
+        region: AWS region for the client
+
+    Returns:
+        botocore client for the service
+    """
+    return _session.client(service, region_name=region, config=_config)
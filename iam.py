@@ -1,74 +1,144 @@
-import boto3
+import functools
 import json
+import logging
 
+from clients import client
+from policies import TRUST_POLICY_JSON
 
-def create_iam_role(role_name="api_gateway_role"):
-    iam = boto3.client("iam")
+logger = logging.getLogger(__name__)
+
+iam = client("iam")
+
+# Policy document for create_iam_policy
+_LOGS_POLICY_JSON = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Action": ["logs:*"],
+                "Resource": "*",
+            }
+        ],
+    }
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_iam_snapshot():
+    """
+    Load every role and customer managed policy in the account with one paginated call.
+
+    Replaces chained get_role/get_policy lookups. The result is cached for the
+    life of the process; call _invalidate_iam_cache() after any change.
+
+    Returns:
+        dict: {"roles": {role name: arn}, "policies": {local policy name: arn}}
+    """
+    snapshot = {"roles": {}, "policies": {}}
+    paginator = iam.get_paginator("get_account_authorization_details")
+    # AWS managed policies are left out: there are over a thousand of them and
+    # they're only needed when a name isn't found here (see _load_aws_policies)
+    for page in paginator.paginate(Filter=["Role", "LocalManagedPolicy"]):
+        for role in page.get("RoleDetailList", []):
+            snapshot["roles"][role["RoleName"]] = role["Arn"]
+        for policy in page.get("Policies", []):
+            snapshot["policies"][policy["PolicyName"]] = policy["Arn"]
+    return snapshot
+
+
+@functools.lru_cache(maxsize=1)
+def _load_aws_policies():
+    """
+    Load the ARN of every AWS managed policy with one paginated call.
+
+    Needed because some of them have a path in their ARN, e.g.
+    service-role/AWSLambdaBasicExecutionRole. Only loaded the first time a
+    name isn't a customer policy, and cached for the life of the process
+    since AWS managed policies don't change.
+
+    Returns:
+        dict: AWS managed policy name -> arn
+    """
+    paginator = iam.get_paginator("list_policies")
+    return {
+        policy["PolicyName"]: policy["Arn"]
+        for page in paginator.paginate(Scope="AWS")
+        for policy in page.get("Policies", [])
+    }
+
+
+def _invalidate_iam_cache():
+    """Drop the cached snapshot and the policy ARNs resolved from it."""
+    _load_iam_snapshot.cache_clear()
+    get_iam_policy_arn.cache_clear()
+
+
+def _prompt_policy_names():
+    policy_names = [input("Enter policy name: ")]
+    while input("Press Y to attach policy to role or N to skip: ") == "Y":
+        policy_names.append(input("Enter policy name: "))
+    return policy_names
+
+
+def create_iam_role(role_name="api_gateway_role", policy_names=None):
     # iam.create_user(UserName="api_gateway_role")
-    # Create role
-    role = iam.get_role(RoleName=role_name)
-    if not role:
-        # for API Gateway Trust Policy
+    # Create role only if it doesn't exist yet
+    role_arn = _load_iam_snapshot()["roles"].get(role_name)
+    if not role_arn:
         role = iam.create_role(
             RoleName=role_name,
-            AssumeRolePolicyDocument=json.dumps(
-                {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Principal": {"Service": "apigateway.amazonaws.com"},
-                            "Action": "sts:AssumeRole",
-                        }
-                    ],
-                }
-            ),
-        )
-    # Attach policy to role
-    attach_policy = True
-    while attach_policy:
-        policy_name = input("Enter policy name: ")
-        iam.attach_role_policy(
-            RoleName=role_name,
-            PolicyArn=get_iam_policy_arn(policy_name),
+            AssumeRolePolicyDocument=TRUST_POLICY_JSON,
         )
-        if input("Press Y to attach policy to role or N to skip: ") == "Y":
-            attach_policy = True
-            policy_name = input("Enter policy name: ")
-        else:
-            attach_policy = False
-            break
+        role_arn = role["Role"]["Arn"]
+        _invalidate_iam_cache()
+    # Attach only the policies that aren't attached yet
+    if policy_names is None:
+        policy_names = _prompt_policy_names()
+    desired = {get_iam_policy_arn(policy_name) for policy_name in policy_names}
+    attached = (
+        iam.get_paginator("list_attached_role_policies")
+        .paginate(RoleName=role_name)
+        .build_full_result()["AttachedPolicies"]
+    )
+    existing = {policy["PolicyArn"] for policy in attached}
+    for policy_arn in desired - existing:
+        iam.attach_role_policy(RoleName=role_name, PolicyArn=policy_arn)
 
-    print(f"Created role {role['Role']['Arn']}")
-    return role["Role"]["Arn"]
+    logger.info("Created role %s", role_arn)
+    return role_arn
 
 
 def create_iam_policy(policy_name):
-    iam = boto3.client("iam")
+    policy_arn = _load_iam_snapshot()["policies"].get(policy_name)
+    if policy_arn:
+        logger.info("Policy %s already exists: %s", policy_name, policy_arn)
+        return policy_arn
+
     policy = iam.create_policy(
         PolicyName=policy_name,
-        PolicyDocument=json.dumps(
-            {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Action": ["logs:*"],
-                        "Resource": "*",
-                    }
-                ],
-            }
-        ),
+        PolicyDocument=_LOGS_POLICY_JSON,
     )
-    print(f"Created policy {policy['Policy']['Arn']}")
+    _invalidate_iam_cache()
+    logger.info("Created policy %s", policy["Policy"]["Arn"])
     return policy["Policy"]["Arn"]
 
 
+@functools.lru_cache(maxsize=256)
 def get_iam_policy_arn(policy_name):
-    iam = boto3.client("iam")
-    policy = iam.get_policy(PolicyArn=policy_name)
-    return policy["Policy"]["Arn"]
+    # Policy ARNs don't change, so look each one up once per process.
+    # Reset with _invalidate_iam_cache() along with the snapshot.
+    if policy_name.startswith("arn:"):
+        return policy_name
+    policy_arn = _load_iam_snapshot()["policies"].get(policy_name)
+    if not policy_arn:
+        # Not a policy in this account, so look it up among the AWS managed ones
+        policy_arn = _load_aws_policies().get(policy_name)
+    if not policy_arn:
+        raise ValueError(f"No customer or AWS managed policy named {policy_name}")
+    return policy_arn
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
     create_iam_role()
@@ -1,13 +1,279 @@
-import boto3
-from api_gateway import APIGateway
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from typing import Final
 
+# Lambda function, IAM role and DynamoDB request template used by the integrations
+LAMBDA_ARN: Final = "arn:aws:lambda:us-east-1:924305315075:function:printHelloWorld"
+LAMBDA_URI: Final = f"arn:aws:apigateway:us-east-1:lambda:path/2015-03-31/functions/{LAMBDA_ARN}/invocations"
+ROLE_ARN: Final = "arn:aws:iam::924305315075:role/api_gateway_role"
+DDB_TEMPLATE: Final = '{"TableName": "job_portals", "Item": $input.json("$")}'
+
+# Integration type -> extra define_method arguments for a route spec
+INTEGRATION_BUILDERS: Final = {
+    "AWS_PROXY": lambda spec: dict(uri=spec.get("uri") or LAMBDA_URI),
+    "AWS": lambda spec: dict(
+        uri=f"arn:aws:apigateway:us-east-1:dynamodb:action/{spec['action']}",
+        credentials=ROLE_ARN,
+        request_parameters={
+            "integration.request.header.Content-Type": "'application/x-amz-json-1.0'",
+        },
+        request_templates={"application/json": DDB_TEMPLATE},
+        passthrough_behavior="WHEN_NO_TEMPLATES",
+        timeout_in_millis=29000,
+    ),
+    "HTTP": lambda spec: dict(uri=spec.get("uri") or LAMBDA_URI, credentials=ROLE_ARN),
+}
+
+# state_machine_arn = (
+#     "arn:aws:states:us-east-1:924305315075:stateMachine:MyStateMachine"
+# )
+# action_arn = "arn:aws:apigateway:<region>:<service>:action/<ActionName>
+
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_connection(apigateway_client):
+    """Make a cheap call so the TLS connection is already pooled for the first real call."""
+    try:
+        apigateway_client.get_rest_apis(limit=1)
+    except Exception as e:
+        # Only a warm-up; the real calls report their own errors
+        logger.debug("Connection warm-up failed: %s", e)
+
+
+def yn(prompt, answer=None):
+    """Ask a y/n question. A preset answer (from --yes/--no-yes) skips the prompt."""
+    if answer is not None:
+        return answer
+    return input(prompt).strip().lower() in {"y", "yes"}
+
+
+async def ainput(prompt):
+    """Prompt for input without blocking the event loop, so API calls keep running."""
+    return await asyncio.to_thread(input, prompt)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Add a route (resource, method and integration) to an API Gateway "
+        "and deploy it. Prompts for anything not given on the command line."
+    )
+    parser.add_argument(
+        "--spec",
+        type=argparse.FileType("r"),
+        help="JSON file with a list of routes, each with api_id, resource_path, "
+        "method, integration_type and optionally integration_http_method, uri, "
+        "action, parent_id and stage",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Provision the APIs in a spec file in up to this many worker processes",
+    )
+    parser.add_argument(
+        "--yes",
+        action=argparse.BooleanOptionalAction,
+        help="Answer every y/n prompt with yes (--yes) or no (--no-yes)",
+    )
+    parser.add_argument("--api-id", help="ID of an existing API Gateway")
+    parser.add_argument("--resource", help="Resource path to create, e.g. /jobs")
+    parser.add_argument("--method", help="HTTP method: GET, POST, PUT, DELETE")
+    parser.add_argument(
+        "--integration-type",
+        choices=["AWS_PROXY", "AWS", "HTTP"],
+        help="Integration type (default: AWS_PROXY when --api-id, --resource and "
+        "--method are all given)",
+    )
+    parser.add_argument(
+        "--integration-http-method",
+        help="HTTP method API Gateway uses to call the integration (default: POST "
+        "when --api-id, --resource and --method are all given)",
+    )
+    parser.add_argument("--uri", help="Integration URI (defaults to the example Lambda)")
+    parser.add_argument("--action", help="DynamoDB action for AWS integrations, e.g. PutItem")
+    args = parser.parse_args(argv)
+    if args.integration_type == "AWS" and not args.action:
+        parser.error("--action is required with --integration-type AWS")
+    return args
+
+
+def _define_route(api_gateway, spec):
+    """
+    Record the resource, method and integration described by spec.
+
+    Nothing is sent to API Gateway here; APIGateway.flush() creates everything.
+
+    Returns:
+        APIResource: The resource the method was defined on
+    """
+    # Check the spec first so a bad route leaves nothing half-recorded
+    integration_type = spec["integration_type"]
+    if integration_type not in INTEGRATION_BUILDERS:
+        raise ValueError(f"Unsupported integration type: {integration_type}")
+    if integration_type == "AWS" and not spec.get("action"):
+        raise ValueError("Route spec with integration_type AWS is missing 'action'")
+
+    if spec.get("parent_id"):
+        resource = api_gateway.get_resource(
+            restApiId=api_gateway.api_id, resourceId=spec["parent_id"]
+        )
+    else:
+        resource = api_gateway.get_root_resource()
+    for path_part in spec.get("resource_path", "").strip("/").split("/"):
+        if path_part:
+            resource = api_gateway.define_resource(resource, path_part)
+
+    resource.define_method(
+        http_method=spec["method"].upper(),
+        integration_type=integration_type,
+        integration_http_method=spec.get("integration_http_method", "POST"),
+        **INTEGRATION_BUILDERS[integration_type](spec),
+    )
+    return resource
+
+
+async def provision(api_gateway, specs):
+    """
+    Add every route in specs to one API with a single import, then deploy it.
+
+    Returns:
+        dict: Stage name -> deploy_to_stage response
+    """
+    for spec in specs:
+        resource = await asyncio.to_thread(_define_route, api_gateway, spec)
+        print(f"Defined {spec['method'].upper()} {resource.path}")
+
+    # Create the resources, methods and integrations with one OpenAPI import
+    await asyncio.to_thread(api_gateway.flush)
+
+    deployments = {}
+    for stage_name in sorted({spec.get("stage", "dev") for spec in specs}):
+        deployments[stage_name] = await asyncio.to_thread(
+            api_gateway.deploy_to_stage,
+            stage_name=stage_name,
+            description="Initial deployment",
+        )
+        print(f"Deployed {api_gateway.api_id} at stage '{stage_name}': {deployments[stage_name]['url']}")
+    return deployments
+
+
+def _invoke_urls(deployments):
+    """Reduce provision()'s deploy responses to stage name -> invoke URL."""
+    return {stage_name: deployment["url"] for stage_name, deployment in deployments.items()}
+
+
+def provision_one(api_id, specs, region):
+    """
+    Provision one API's routes in a worker process.
+
+    Module-level so ProcessPoolExecutor can pickle it; each worker builds its
+    own boto3 client.
+
+    Returns:
+        dict: Stage name -> invoke URL
+    """
+    from api_gateway import APIGateway
+    from clients import client
+
+    # Spawned workers don't inherit the parent's logging setup
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    api_gateway = APIGateway(region=region, apigateway_client=client("apigateway", region))
+    api_gateway.get_api_gateway(api_id)
+    return _invoke_urls(asyncio.run(provision(api_gateway, specs)))
+
+
+async def provision_all(apigateway_client, region, specs, processes=1):
+    """
+    Provision routes for several APIs concurrently, one import and deployment per API.
+
+    With processes > 1 each API is provisioned in a separate worker process,
+    otherwise all APIs share this process's event loop and client.
+
+    Returns:
+        list: One dict of stage name -> invoke URL per API
+    """
+    from api_gateway import APIGateway
+
+    async def provision_api(api_id, api_specs):
+        api_gateway = APIGateway(region=region, apigateway_client=apigateway_client)
+        await asyncio.to_thread(api_gateway.get_api_gateway, api_id)
+        return _invoke_urls(await provision(api_gateway, api_specs))
+
+    by_api = [
+        (api_id, list(api_specs))
+        for api_id, api_specs in groupby(
+            sorted(specs, key=lambda spec: spec["api_id"]), key=lambda spec: spec["api_id"]
+        )
+    ]
+    if processes > 1 and len(by_api) > 1:
+        loop = asyncio.get_running_loop()
+        # Spawn rather than fork: boto3 clients and their connection pools
+        # must not be shared with child processes
+        with ProcessPoolExecutor(
+            max_workers=min(processes, len(by_api)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            return await asyncio.gather(
+                *(
+                    loop.run_in_executor(executor, provision_one, api_id, api_specs, region)
+                    for api_id, api_specs in by_api
+                )
+            )
+
+    return await asyncio.gather(
+        *(provision_api(api_id, api_specs) for api_id, api_specs in by_api)
+    )
+
+
+async def main(argv=None):
+    args = parse_args(argv)
+
+    # Imported only now: boto3 is slow to load, and --help or bad arguments
+    # shouldn't have to wait for it
+    from api_gateway import APIGateway
+    from clients import client
 
-def main():
     # Initialize API Gateway in the given region
     region = "us-east-1"
-    api_gateway = APIGateway(region=region)
+    # One pooled, keep-alive client for every call in this run
+    apigateway_client = client("apigateway", region)
+    threading.Thread(
+        target=_warm_connection, args=(apigateway_client,), daemon=True
+    ).start()
 
-    if input("Do you want to create a new API Gateway (y/n)") == "y":
+    # Non-interactive runs: a spec file or a single route from the flags
+    if args.spec:
+        specs = json.load(args.spec)
+        await provision_all(apigateway_client, region, specs, processes=args.processes)
+        return
+    if args.api_id and args.resource and args.method:
+        spec = {
+            "api_id": args.api_id,
+            "resource_path": args.resource,
+            "method": args.method,
+            "integration_type": args.integration_type or "AWS_PROXY",
+            "integration_http_method": args.integration_http_method or "POST",
+            "uri": args.uri,
+            "action": args.action,
+        }
+        await provision_all(apigateway_client, region, [spec])
+        return
+
+    api_gateway = APIGateway(region=region, apigateway_client=apigateway_client)
+
+    # Interactive: start from whatever flags were given, prompt for the rest
+    if args.api_id:
+        existing_api = api_gateway.get_api_gateway(args.api_id)
+        print(f"Using existing API Gateway: {existing_api}")
+    elif yn("Do you want to create a new API Gateway (y/n)", args.yes):
         api_name = input("Enter API Gateway name: ")
         api_gateway.create_rest_api_gateway(api_name)
     else:
@@ -15,82 +281,48 @@ def main():
         existing_api = api_gateway.get_api_gateway(api_id)
         print(f"Using existing API Gateway: {existing_api}")
 
-    integration_type = input("Enter integration type: AWS_PROXY, AWS, HTTP: ")
+    # Load the existing resource tree while the route details are being entered
+    load_resources = asyncio.create_task(
+        asyncio.to_thread(api_gateway.get_root_resource)
+    )
+
+    spec = {"uri": args.uri, "action": args.action}
+    spec["integration_type"] = args.integration_type or await ainput(
+        "Enter integration type: AWS_PROXY, AWS, HTTP: "
+    )
     # Get root resource
-    if input("Is resource root is main resource (y/n)").lower() == "y":
-        root_resource = api_gateway.get_root_resource()
-        resource_name = input("Enter new resource name: ").strip()
-        current_resource = api_gateway.create_resource(root_resource, resource_name)
-        print(f"Successfully created resource: {resource_name}")
+    if args.resource:
+        spec["resource_path"] = args.resource
+    elif await asyncio.to_thread(yn, "Is resource root is main resource (y/n)", args.yes):
+        spec["resource_path"] = (await ainput("Enter new resource name: ")).strip()
     else:
-        resource_id = input("Enter parent resource id: ")
-        current_resource = api_gateway.get_resource(restApiId=api_id, resourceId=resource_id)
-        print(f"Using parent resource: {current_resource.path}")
-
-        if input(f"Want to create new resource from {current_resource.path} (y/n)").lower() == "y":
-            resource_name = input("Enter new resource name: ").strip()
-            current_resource = api_gateway.create_resource(current_resource, resource_name)
-            print(f"Successfully created resource: {resource_name}")
-
-    http_method = input("Enter HTTP method: GET, POST, PUT, DELETE: ").upper()
-    current_resource.add_method(http_method=http_method, authorization_type="NONE")
-    integration_http_method = input("Enter integration HTTP method: ")
-
-    # Add Lambda integration
-    lambda_arn = "arn:aws:lambda:us-east-1:924305315075:function:printHelloWorld"
-    lambda_uri = f"arn:aws:apigateway:us-east-1:lambda:path/2015-03-31/functions/{lambda_arn}/invocations"
-
-    # state_machine_arn = (
-    #     "arn:aws:states:us-east-1:924305315075:stateMachine:MyStateMachine"
-    # )
-    # action_arn = "arn:aws:apigateway:<region>:<service>:action/<ActionName>
-    action_name = input(
-        "Enter action name for dynamo db: GetItem, PutItem, DeleteItem, UpdateItem\n"
-    )
-    dynamo_db_action_arn = f"arn:aws:apigateway:us-east-1:dynamodb:action/{action_name}"
-    dynamo_db_template = '{"TableName": "job_portals", "Item": $input.json("$")}'
-
-    if integration_type == "AWS_PROXY":
-        current_resource.add_integration(
-            http_method=http_method,
-            integration_type=integration_type,
-            integration_http_method=integration_http_method,
-            uri=lambda_uri,
-        )
-    elif integration_type == "AWS":
-        current_resource.add_integration(
-            http_method=http_method,
-            integration_type=integration_type,
-            integration_http_method=integration_http_method,
-            uri=f"{dynamo_db_action_arn}",
-            credentials="arn:aws:iam::924305315075:role/api_gateway_role",
-            request_parameters={
-                "integration.request.header.Content-Type": "'application/x-amz-json-1.0'",
-            },
-            request_templates={"application/json": dynamo_db_template},
-            passthrough_behavior="WHEN_NO_TEMPLATES",
-            timeout_in_millis=29000,
-        )
-    elif integration_type == "HTTP":
-        current_resource.add_integration(
-            http_method=http_method,
-            integration_type=integration_type,
-            integration_http_method=integration_http_method,
-            uri=lambda_uri,
-            credentials="arn:aws:iam::924305315075:role/api_gateway_role",
+        spec["parent_id"] = await ainput("Enter parent resource id: ")
+        await load_resources
+        parent_resource = api_gateway.get_resource(
+            restApiId=api_gateway.api_id, resourceId=spec["parent_id"]
         )
+        print(f"Using parent resource: {parent_resource.path}")
+
+        if await asyncio.to_thread(
+            yn, f"Want to create new resource from {parent_resource.path} (y/n)", args.yes
+        ):
+            spec["resource_path"] = (await ainput("Enter new resource name: ")).strip()
 
-    # Deploy the API
-    # print("Deploying API...")
-    # deployment = api_gateway.deploy_to_stage(
-    #     stage_name='dev',
-    #     description='Initial deployment'
-    # )
+    spec["method"] = (
+        args.method or await ainput("Enter HTTP method: GET, POST, PUT, DELETE: ")
+    ).upper()
+    spec["integration_http_method"] = args.integration_http_method or await ainput(
+        "Enter integration HTTP method: "
+    )
+    if spec["integration_type"] == "AWS" and not spec["action"]:
+        spec["action"] = await ainput(
+            "Enter action name for dynamo db: GetItem, PutItem, DeleteItem, UpdateItem\n"
+        )
 
-    # print(f"\nAPI deployed successfully!")
-    # print(f"Endpoint: {deployment['url'].rstrip('/')}/code")
-    # print("Deployed at stage 'dev'")
+    await load_resources
+    await provision(api_gateway, [spec])
 
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    asyncio.run(main())
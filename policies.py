@@ -0,0 +1,16 @@
+import json
+
+# Lets API Gateway assume a role; used by iam.create_iam_role and
+# APIGateway.create_gateway_role_with_policy
+TRUST_POLICY_JSON = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": {"Service": "apigateway.amazonaws.com"},
+                "Action": "sts:AssumeRole",
+            }
+        ],
+    }
+)
@@ -6,10 +6,6 @@ from botocore.exceptions import ClientError
 
 # secret_name = "test/demodbMySql"
 #     region_name = "us-east-1"
-parser = argparse.ArgumentParser()
-parser.add_argument("--secret", type = str, required=True)
-parser.add_argument("--region", type = str, required=False)
-args = parser.parse_args()
 
 
 def get_secret(s,r):
@@ -61,6 +57,11 @@ def get_secret(s,r):
 
 
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secret", type = str, required=True)
+    parser.add_argument("--region", type = str, required=False)
+    args = parser.parse_args()
+
     secret_name = args.secret
     region_name = args.region
     password=get_secret(secret_name,region_name)